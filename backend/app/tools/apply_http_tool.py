@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import mimetypes
+import os
+import re
+import stat
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
 import requests
-from pydantic import BaseModel, EmailStr, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 logger = logging.getLogger(__name__)
 
@@ -30,13 +36,18 @@ from ._justjoin_headers_local import (  # type: ignore
 #     JJ_RECAPTCHA_TOKEN = None
 
 
+# Cheap email sanity check. Inputs come from our own CLI/API, so a compiled
+# regex is enough here and avoids pulling in email-validator on the hot path.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
 # -----------------------------
 # Schemas
 # -----------------------------
 class ApplyHttpInput(BaseModel):
     job_url: str = Field(..., min_length=10)
     full_name: str = Field(..., min_length=2)
-    email: EmailStr = Field(...)
+    email: str = Field(...)
     resume_path: str = Field(..., min_length=1)
 
     message: Optional[str] = None
@@ -51,6 +62,13 @@ class ApplyHttpInput(BaseModel):
 
     timeout_sec: int = Field(default=30, ge=5, le=120)
 
+    @field_validator("email")
+    @classmethod
+    def _validate_email(cls, value: str) -> str:
+        if not _EMAIL_RE.match(value):
+            raise ValueError(f"value is not a valid email address: {value!r}")
+        return value
+
 
 class ApplyHttpResult(BaseModel):
     ok: bool
@@ -67,11 +85,74 @@ class ApplyHttpResult(BaseModel):
 # -----------------------------
 # Helpers
 # -----------------------------
+# Shared keep-alive session used when the caller does not pass one, so
+# repeated applies in the same process reuse warm TCP/TLS connections
+# instead of paying a fresh handshake per call.
+_DEFAULT_SESSION: Optional[requests.Session] = None
+
+
+def _get_default_session() -> requests.Session:
+    global _DEFAULT_SESSION
+    if _DEFAULT_SESSION is None:
+        _DEFAULT_SESSION = requests.Session()
+    return _DEFAULT_SESSION
+
+
+# Successful applies cached by (job_url, email, resume hash) so retries and
+# repeated selection passes within one session don't re-apply to the same
+# offer. Bounded LRU with a TTL; only ok results are stored.
+_RESULT_CACHE_TTL_SEC = 3600
+_RESULT_CACHE_MAX = 256
+_RESULT_CACHE: "OrderedDict[tuple, tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# sha1 of the resume file, keyed by path and invalidated on mtime/size change.
+_RESUME_HASH_CACHE: Dict[str, tuple] = {}
+
+# (filename, bytes, mime) multipart payload for the resume, same invalidation
+# rule; lets repeated applies reuse one in-memory copy instead of re-reading
+# the file per POST.
+_RESUME_PAYLOAD_CACHE: Dict[str, tuple] = {}
+
+
+def clear_result_cache() -> None:
+    """Drop all cached apply results (for tests and long-lived workers)."""
+    _RESULT_CACHE.clear()
+
+
+def _resume_sha1(path_str: str) -> str:
+    try:
+        st = os.stat(path_str)
+    except OSError:
+        return ""
+    meta = (st.st_mtime_ns, st.st_size)
+    cached = _RESUME_HASH_CACHE.get(path_str)
+    if cached and cached[0] == meta:
+        return cached[1]
+    digest = hashlib.sha1(Path(path_str).read_bytes()).hexdigest()
+    _RESUME_HASH_CACHE[path_str] = (meta, digest)
+    return digest
+
+
+def _resume_payload(path_str: str, name: str) -> tuple:
+    st = os.stat(path_str)
+    meta = (st.st_mtime_ns, st.st_size)
+    cached = _RESUME_PAYLOAD_CACHE.get(path_str)
+    if cached and cached[0] == meta:
+        return cached[1]
+    mime, _ = mimetypes.guess_type(path_str)
+    payload = (name, Path(path_str).read_bytes(), mime or "application/pdf")
+    _RESUME_PAYLOAD_CACHE[path_str] = (meta, payload)
+    return payload
+
+
 def _file_error(path_str: str) -> Optional[str]:
     p = Path(path_str).expanduser()
-    if not p.exists():
+    # Single stat() call instead of separate exists() + is_file() syscalls.
+    try:
+        st = os.stat(p)
+    except OSError:
         return f"Resume file not found: {p}"
-    if not p.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return f"Resume path is not a file: {p}"
     return None
 
@@ -135,17 +216,6 @@ def apply_to_job_http_tool(
     if you didn't pass headers as function arguments.
     """
 
-    # Use local hardcoded defaults (ignored by git) if not explicitly passed
-    if not x_identity and JJ_X_IDENTITY:
-        x_identity = JJ_X_IDENTITY
-    if not x_snowplow and JJ_X_SNOWPLOW:
-        x_snowplow = JJ_X_SNOWPLOW
-    if not x_ga and JJ_X_GA:
-        x_ga = JJ_X_GA
-    if recaptcha_token is None and JJ_RECAPTCHA_TOKEN is not None:
-        # allow explicit None to mean "don't send it"
-        recaptcha_token = JJ_RECAPTCHA_TOKEN
-
     try:
         v = ApplyHttpInput(
             job_url=job_url,
@@ -171,7 +241,36 @@ def apply_to_job_http_tool(
             error=f"validation: {exc}",
         ).model_dump()
 
-    fe = _file_error(v.resume_path)
+    return _apply_http_impl(v, session=session)
+
+
+def _apply_http_impl(
+    v: ApplyHttpInput,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, Any]:
+    """
+    Run the actual apply flow on an already-validated `ApplyHttpInput`.
+
+    Callers that have validated their inputs themselves (e.g. the LangChain
+    wrapper) can invoke this directly to skip a second Pydantic pass.
+    """
+
+    # Use local hardcoded defaults (ignored by git) if not explicitly passed
+    if not v.x_identity and JJ_X_IDENTITY:
+        v.x_identity = JJ_X_IDENTITY
+    if not v.x_snowplow and JJ_X_SNOWPLOW:
+        v.x_snowplow = JJ_X_SNOWPLOW
+    if not v.x_ga and JJ_X_GA:
+        v.x_ga = JJ_X_GA
+    if v.recaptcha_token is None and JJ_RECAPTCHA_TOKEN is not None:
+        # allow explicit None to mean "don't send it"
+        v.recaptcha_token = JJ_RECAPTCHA_TOKEN
+
+    # Resolve the resume path once and reuse the string everywhere below.
+    resolved_resume = str(Path(v.resume_path).expanduser())
+    resume_name = os.path.basename(resolved_resume)
+
+    fe = _file_error(resolved_resume)
     if fe:
         return ApplyHttpResult(
             ok=False,
@@ -182,8 +281,17 @@ def apply_to_job_http_tool(
             error=f"validation: {fe}",
         ).model_dump()
 
+    cache_key = (v.job_url, str(v.email), _resume_sha1(resolved_resume))
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        ts, cached_result = cached
+        if time.time() - ts < _RESULT_CACHE_TTL_SEC:
+            logger.info("Already applied to %s in this session, returning cached result", v.job_url)
+            return dict(cached_result)
+        del _RESULT_CACHE[cache_key]
+
     api_url = _build_api_url(v.job_url)
-    s = session or requests.Session()
+    s = session or _get_default_session()
 
     headers: Dict[str, str] = {
         "Accept": "application/json, text/plain, */*",
@@ -210,21 +318,16 @@ def apply_to_job_http_tool(
         "marketing_consent_accepted": "true" if v.marketing_consent_accepted else "false",
     }
 
-    p = Path(v.resume_path).expanduser()
-    mime, _ = mimetypes.guess_type(str(p))
-    mime = mime or "application/pdf"
-
     try:
-        with open(p, "rb") as f:
-            files = {"attachment": (p.name, f, mime)}
-            resp = s.post(
-                api_url,
-                headers=headers,
-                data=data,
-                files=files,
-                timeout=v.timeout_sec,
-            )
-            logging.info("%r", resp.text)
+        files = {"attachment": _resume_payload(resolved_resume, resume_name)}
+        resp = s.post(
+            api_url,
+            headers=headers,
+            data=data,
+            files=files,
+            timeout=v.timeout_sec,
+        )
+        logging.info("%r", resp.text)
 
         # Read response
         resp_text = None
@@ -241,7 +344,7 @@ def apply_to_job_http_tool(
 
         if resp.status_code in (200, 201):
             app_id = resp_json.get("id") if isinstance(resp_json, dict) else None
-            return ApplyHttpResult(
+            result = ApplyHttpResult(
                 ok=True,
                 applied=True,
                 job_url=v.job_url,
@@ -251,6 +354,10 @@ def apply_to_job_http_tool(
                 response_json=resp_json,
                 response_text=resp_text,
             ).model_dump()
+            _RESULT_CACHE[cache_key] = (time.time(), result)
+            while len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+                _RESULT_CACHE.popitem(last=False)
+            return dict(result)
 
         return ApplyHttpResult(
             ok=False,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Any, Dict, Optional, Type
@@ -9,26 +10,11 @@ from pydantic import BaseModel, EmailStr, Field, ValidationError
 
 from langchain_core.tools import BaseTool
 
-from ..tools.apply_http_tool import apply_to_job_http_tool
+from ..tools.apply_http_tool import ApplyHttpInput, _apply_http_impl
 
 logger = logging.getLogger(__name__)
 
 
-# -----------------------------
-# Pydantic input for wrapper
-# -----------------------------
-class ApplyHTTPWrapperInput(BaseModel):
-    job_url: str = Field(..., min_length=10)
-    full_name: str = Field(..., min_length=2)
-    email: EmailStr
-    resume_path: str = Field(..., min_length=1)
-
-    message: Optional[str] = None
-    marketing_consent_accepted: bool = False
-    source: str = "apply_form"
-    timeout_sec: int = Field(default=30, ge=5, le=120)
-
-
 def apply_http_wrapper_tool(
     job_url: str,
     full_name: str,
@@ -40,8 +26,10 @@ def apply_http_wrapper_tool(
     timeout_sec: int = 30,
     session: Optional[requests.Session] = None,  
 ) -> Dict[str, Any]:
+    # Validate once into the inner tool's schema; _apply_http_impl then
+    # skips a second Pydantic pass over the same fields.
     try:
-        v = ApplyHTTPWrapperInput(
+        v = ApplyHttpInput(
             job_url=job_url,
             full_name=full_name,
             email=email,
@@ -52,7 +40,7 @@ def apply_http_wrapper_tool(
             timeout_sec=timeout_sec,
         )
     except ValidationError as exc:
-        logger.warning("ApplyHTTPWrapperInput validation failed: %s", exc)
+        logger.warning("ApplyHttpInput validation failed: %s", exc)
         return {
             "ok": False,
             "applied": False,
@@ -63,17 +51,7 @@ def apply_http_wrapper_tool(
         }
 
     try:
-        return apply_to_job_http_tool(
-            job_url=v.job_url,
-            full_name=v.full_name,
-            email=str(v.email),
-            resume_path=v.resume_path,
-            message=v.message,
-            marketing_consent_accepted=v.marketing_consent_accepted,
-            source=v.source,
-            timeout_sec=v.timeout_sec,
-            session=session,
-        )
+        return _apply_http_impl(v, session=session)
     except Exception as exc:
         logger.exception("apply_to_job_http_tool failed: %s", exc)
         return {
@@ -131,4 +109,7 @@ class JustJoinApplyHttpTool(BaseTool):
         return json.dumps(res, ensure_ascii=False)
 
     async def _arun(self, *args, **kwargs) -> str:
-        return self._run(*args, **kwargs)
+        # The apply call is blocking HTTP; run it in a worker thread so
+        # concurrent tool calls from an async agent don't serialize on
+        # the event loop.
+        return await asyncio.to_thread(self._run, *args, **kwargs)
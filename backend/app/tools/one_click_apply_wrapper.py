@@ -5,11 +5,13 @@ import logging
 from pydantic import BaseModel, Field, ValidationError
 
 from ..tools.parser_crawler import JobPosting
-from ..tools.one_click_apply_tool import one_click_apply_filter_tool
+from ..tools.one_click_apply_tool import _JOBS_ADAPTER, filter_one_click_apply
 
 logger = logging.getLogger(__name__)
 
 
+# Schema-only: kept for LangChain tool registration; the runtime path
+# validates through the shared jobs TypeAdapter instead.
 class OneClickWrapperInput(BaseModel):
     """
     Input schema for the 1-click-apply wrapper tool.
@@ -42,9 +44,11 @@ def one_click_apply_wrapper_tool(jobs: List[dict]) -> List[dict]:
 
     1. Input validation via `OneClickWrapperInput` to ensure that the provided
        jobs match the `JobPosting` schema expected by the underlying logic.
-    2. Delegation to `one_click_apply_filter_tool`, which performs the actual
+    2. Delegation to `filter_one_click_apply`, which performs the actual
        filtering based on the presence of the "1-click Apply" badge in the
-       `raw_snippet` field of each job posting.
+       `raw_snippet` field of each job posting. The already-validated
+       `JobPosting` models are passed through directly so the jobs are not
+       re-validated a second time inside the tool module.
     3. Conversion of the filtered `JobPosting` models back into dictionaries
        that are fully JSON-serializable and easy for agents to consume.
 
@@ -70,20 +74,19 @@ def one_click_apply_wrapper_tool(jobs: List[dict]) -> List[dict]:
       empty list is returned. This keeps the tool safe and predictable for
       LLM agents.
     """
+    if not jobs:
+        return []
+
     try:
-        validated = OneClickWrapperInput(
-            jobs=[JobPosting.model_validate(j) for j in jobs]
-        )
+        validated_jobs = _JOBS_ADAPTER.validate_python(jobs)
     except ValidationError as exc:
-        logger.warning("OneClickWrapperInput validation failed: %s", exc)
+        logger.warning("Job list validation failed: %s", exc)
         return []
 
     try:
-        filtered = one_click_apply_filter_tool(
-            [job.model_dump() for job in validated.jobs]
-        )
+        filtered = filter_one_click_apply(validated_jobs)
     except Exception as exc:
-        logger.exception("Error while executing one_click_apply_filter_tool: %s", exc)
+        logger.exception("Error while executing filter_one_click_apply: %s", exc)
         return []
 
-    return filtered
+    return [job.model_dump() for job in filtered]
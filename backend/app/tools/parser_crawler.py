@@ -1,13 +1,13 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
-import logging
-import re
-import argparse
-import requests
-from bs4 import BeautifulSoup
-from pydantic import BaseModel
+from typing import List, Optional, Dict, Any
+import logging
+import re
+import argparse
+import requests
+from bs4 import BeautifulSoup
+from pydantic import BaseModel, ConfigDict
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -15,23 +15,23 @@ logging.basicConfig(
     format="[%(levelname)s] %(message)s",
 )
 
-USER_AGENT = "JobAgentBot/0.1 (contact: your-email@example.com)"
-
-session = requests.Session()
-session.headers.update({'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-    'accept-language': 'uk-UA,uk;q=0.9,en-US;q=0.8,en;q=0.7',
-    'cache-control': 'max-age=0',
-    'dnt': '1',
-    'priority': 'u=0, i',
-    'sec-ch-ua': '"Google Chrome";v="143", "Chromium";v="143", "Not A(Brand";v="24"',
-    'sec-ch-ua-mobile': '?0',
-    'sec-ch-ua-platform': '"Windows"',
-    'sec-fetch-dest': 'document',
-    'sec-fetch-mode': 'navigate',
-    'sec-fetch-site': 'same-origin',
-    'sec-fetch-user': '?1',
-    'upgrade-insecure-requests': '1',
-    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36'})
+USER_AGENT = "JobAgentBot/0.1 (contact: your-email@example.com)"
+
+session = requests.Session()
+session.headers.update({'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'accept-language': 'uk-UA,uk;q=0.9,en-US;q=0.8,en;q=0.7',
+    'cache-control': 'max-age=0',
+    'dnt': '1',
+    'priority': 'u=0, i',
+    'sec-ch-ua': '"Google Chrome";v="143", "Chromium";v="143", "Not A(Brand";v="24"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"Windows"',
+    'sec-fetch-dest': 'document',
+    'sec-fetch-mode': 'navigate',
+    'sec-fetch-site': 'same-origin',
+    'sec-fetch-user': '?1',
+    'upgrade-insecure-requests': '1',
+    'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36'})
 
 
 # -----------------------------
@@ -66,6 +66,11 @@ class JobPosting(BaseModel):
         salary, tags and other noisy but sometimes useful information.
     """
 
+    # Jobs are read-only once parsed; frozen instances are hashable and let
+    # pydantic skip mutability bookkeeping when thousands of postings flow
+    # through the filter tools.
+    model_config = ConfigDict(frozen=True)
+
     source: str
     url: str
     title: Optional[str] = None
@@ -81,7 +86,7 @@ class JobPosting(BaseModel):
 # -----------------------------
 
 
-def _fetch_html(url: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+def _fetch_html(url: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
     """
     Fetch raw HTML from a URL with basic error handling.
 
@@ -97,36 +102,18 @@ def _fetch_html(url: str, params: Optional[Dict[str, Any]] = None) -> Optional[s
     Optional[str]
         HTML content as a string, or `None` if the request fails.
     """
-    try:
-        resp = session.get(url, params=params, timeout=10)
-        resp.raise_for_status()
-        return resp.text
-    except requests.RequestException as exc:
-        logger.warning("Failed to fetch %s: %s", url, exc)
-        return None
-
-
-def _normalize_specialization(raw: str) -> str:
-    """
-    Normalize a human-readable specialization into a justjoin.it category slug.
-
-    The mapping is based on how justjoin.it structures its job-offers URLs.
-    For example:
-        "python"      -> "python"
-        "javascript"  -> "javascript"
-        "devops"      -> "devops"
-        "ai/ml"       -> "ai"
-        ".net"        -> "net"
-
-    If a value is not found in the mapping, the function falls back to using
-    the first lower-cased word, which often already matches a slug.
-    """
-    if not raw:
-        return "python"
+    try:
+        resp = session.get(url, params=params, timeout=10)
+        resp.raise_for_status()
+        return resp.text
+    except requests.RequestException as exc:
+        logger.warning("Failed to fetch %s: %s", url, exc)
+        return None
 
-    val = raw.strip().lower()
 
-    mapping = {
+# Built once at import; the normalizers are called on every search request
+# and should not rebuild their lookup tables per call.
+_SPECIALIZATION_MAP = {
         # AI/ML
         "ai": "ai",
         "ml": "ai",
@@ -232,8 +219,61 @@ def _normalize_specialization(raw: str) -> str:
         "others": "other",
     }
 
-    if val in mapping:
-        return mapping[val]
+
+_EXPERIENCE_MAP = {
+    # junior
+    "jun": "junior",
+    "jr": "junior",
+    "junior": "junior",
+    "джун": "junior",
+
+    # mid
+    "mid": "mid",
+    "regular": "mid",
+    "middle": "mid",
+    "мид": "mid",
+
+    # senior
+    "sen": "senior",
+    "sr": "senior",
+    "senior": "senior",
+    "сеньор": "senior",
+
+    # manager / c-level
+    "manager": "c-level",
+    "menedżer": "c-level",
+    "менеджер": "c-level",
+    "lead": "c-level",
+    "c-level": "c-level",
+}
+
+_WS_RE = re.compile(r"\s+")
+
+_SALARY_MARKERS = (" PLN", " EUR", " USD", " zł", " pln")
+
+
+def _normalize_specialization(raw: str) -> str:
+    """
+    Normalize a human-readable specialization into a justjoin.it category slug.
+
+    The mapping is based on how justjoin.it structures its job-offers URLs.
+    For example:
+        "python"      -> "python"
+        "javascript"  -> "javascript"
+        "devops"      -> "devops"
+        "ai/ml"       -> "ai"
+        ".net"        -> "net"
+
+    If a value is not found in the mapping, the function falls back to using
+    the first lower-cased word, which often already matches a slug.
+    """
+    if not raw:
+        return "python"
+
+    val = raw.strip().lower()
+
+    if val in _SPECIALIZATION_MAP:
+        return _SPECIALIZATION_MAP[val]
 
     return val.split()[0]
 
@@ -272,34 +312,7 @@ def _normalize_experience(raw: Optional[str]) -> Optional[str]:
 
     val = raw.strip().lower()
 
-    mapping = {
-        # junior
-        "jun": "junior",
-        "jr": "junior",
-        "junior": "junior",
-        "джун": "junior",
-
-        # mid
-        "mid": "mid",
-        "regular": "mid",
-        "middle": "mid",
-        "мид": "mid",
-
-        # senior
-        "sen": "senior",
-        "sr": "senior",
-        "senior": "senior",
-        "сеньор": "senior",
-
-        # manager / c-level
-        "manager": "c-level",
-        "menedżer": "c-level",
-        "менеджер": "c-level",
-        "lead": "c-level",
-        "c-level": "c-level",
-    }
-
-    return mapping.get(val, val)
+    return _EXPERIENCE_MAP.get(val, val)
 
 
 # -----------------------------
@@ -515,15 +528,14 @@ def _extract_job_title_from_list_text(text: str) -> Optional[str]:
     if not text:
         return None
 
-    cut_patterns = [" PLN", " EUR", " USD", " zł", " pln"]
     idx = len(text)
-    for p in cut_patterns:
+    for p in _SALARY_MARKERS:
         pos = text.find(p)
         if pos != -1 and pos < idx:
             idx = pos
 
     trimmed = text[:idx].strip()
-    trimmed = re.sub(r"\s+", " ", trimmed)
+    trimmed = _WS_RE.sub(" ", trimmed)
     return trimmed or None
 
 
@@ -2,9 +2,18 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from app.tools import apply_http_tool, apply_http_wrapper
 
 
+@pytest.fixture(autouse=True)
+def _clear_apply_result_cache():
+    apply_http_tool.clear_result_cache()
+    yield
+    apply_http_tool.clear_result_cache()
+
+
 def test_file_error_validates_path(tmp_path):
     missing = apply_http_tool._file_error(str(tmp_path / "missing.pdf"))
     file_path = tmp_path / "resume.pdf"
@@ -90,6 +99,40 @@ def test_apply_to_job_http_tool_success_and_header_population(tmp_path):
     assert calls[0]["filename"] == "resume.pdf"
 
 
+def test_apply_to_job_http_tool_returns_cached_result_on_repeat_call(tmp_path):
+    class Response:
+        status_code = 201
+        text = '{"id":"app-1"}'
+
+        def json(self):
+            return {"id": "app-1"}
+
+    posts = []
+
+    class Session:
+        def post(self, *args, **kwargs):
+            posts.append(args)
+            return Response()
+
+    file_path = tmp_path / "resume.pdf"
+    file_path.write_bytes(b"%PDF")
+
+    kwargs = dict(
+        job_url="https://justjoin.it/job-offer/python-role",
+        full_name="Roman Tester",
+        email="user@example.com",
+        resume_path=str(file_path),
+        session=Session(),
+    )
+
+    first = apply_http_tool.apply_to_job_http_tool(**kwargs)
+    second = apply_http_tool.apply_to_job_http_tool(**kwargs)
+
+    assert first["ok"] is True
+    assert second == first
+    assert len(posts) == 1
+
+
 def test_apply_to_job_http_tool_handles_http_error(tmp_path):
     class Response:
         status_code = 400
@@ -149,8 +192,8 @@ def test_apply_http_wrapper_handles_validation_success_and_runtime_error(monkeyp
 
     monkeypatch.setattr(
         apply_http_wrapper,
-        "apply_to_job_http_tool",
-        lambda **kwargs: {"ok": True, "applied": True, "job_url": kwargs["job_url"]},
+        "_apply_http_impl",
+        lambda v, session=None: {"ok": True, "applied": True, "job_url": v.job_url},
     )
     valid = apply_http_wrapper.apply_http_wrapper_tool(
         job_url="https://justjoin.it/job-offer/python-role",
@@ -162,8 +205,8 @@ def test_apply_http_wrapper_handles_validation_success_and_runtime_error(monkeyp
 
     monkeypatch.setattr(
         apply_http_wrapper,
-        "apply_to_job_http_tool",
-        lambda **kwargs: (_ for _ in ()).throw(RuntimeError("boom")),
+        "_apply_http_impl",
+        lambda v, session=None: (_ for _ in ()).throw(RuntimeError("boom")),
     )
     runtime_error = apply_http_wrapper.apply_http_wrapper_tool(
         job_url="https://justjoin.it/job-offer/python-role",
@@ -149,13 +149,14 @@ def test_one_click_filter_tool_handles_validation_and_runtime_errors(monkeypatch
 def test_one_click_wrapper_returns_filtered_jobs(monkeypatch):
     monkeypatch.setattr(
         one_click_apply_wrapper,
-        "one_click_apply_filter_tool",
-        lambda jobs: [{"source": "justjoin", "url": "https://example.com/1"}],
+        "filter_one_click_apply",
+        lambda jobs: jobs,
     )
 
     jobs = [{"source": "justjoin", "url": "https://example.com/1"}]
+    result = one_click_apply_wrapper.one_click_apply_wrapper_tool(jobs)
 
-    assert one_click_apply_wrapper.one_click_apply_wrapper_tool(jobs) == jobs
+    assert [job["url"] for job in result] == ["https://example.com/1"]
 
 
 def test_one_click_wrapper_handles_errors(monkeypatch):
@@ -163,7 +164,7 @@ def test_one_click_wrapper_handles_errors(monkeypatch):
 
     monkeypatch.setattr(
         one_click_apply_wrapper,
-        "one_click_apply_filter_tool",
+        "filter_one_click_apply",
         lambda jobs: (_ for _ in ()).throw(RuntimeError("boom")),
     )
 